@@ -5,11 +5,10 @@ import argparse
 import fnmatch
 import json
 import logging
+import math
 import os
 import sys
 
-import coloredlogs
-
 import happi
 
 from .utils import is_a_range
@@ -74,7 +73,13 @@ def happi_cli(args):
         return
     args = parser.parse_args(args)
 
+    # Version endpoint
+    if args.version:
+        print(f'Happi: Version {happi.__version__} from {happi.__file__}')
+        return
+
     # Logging Level handling
+    import coloredlogs
     if args.verbose:
         shown_logger = logging.getLogger()
         level = "DEBUG"
@@ -84,11 +89,6 @@ def happi_cli(args):
     coloredlogs.install(level=level, logger=shown_logger,
                         fmt='[%(asctime)s] - %(levelname)s -  %(message)s')
     logger.debug("Set logging level of %r to %r", shown_logger.name, level)
-
-    # Version endpoint
-    if args.version:
-        print(f'Happi: Version {happi.__version__} from {happi.__file__}')
-        return
     logger.debug('Command line arguments: %r' % args)
 
     client = happi.client.Client.from_config(cfg=args.path)
@@ -104,7 +104,6 @@ def happi_cli(args):
         regex_list = []
         is_range = False
         for user_arg in args.search_criteria:
-            is_range = False
             if '=' in user_arg:
                 criteria, value = user_arg.split('=', 1)
             else:
@@ -116,38 +115,39 @@ def happi_cli(args):
                     criteria, value, client_args[criteria]
                 )
                 return
-            if value.replace('.', '').isnumeric():
-                logger.debug('Changed %s to float', value)
-                value = str(float(value))
-
-            if is_a_range(value):
+            is_range = is_a_range(value)
+            if is_range:
                 start, stop = value.split(',')
                 start = float(start)
                 stop = float(stop)
-                is_range = True
                 if start < stop:
                     range_list = client.search_range(criteria, start, stop)
                 else:
                     logger.error('Invalid range, make sure start < stop')
-
-            # skip the criteria for range values
-            # it won't be a valid criteria for search_regex()
-            if is_range:
-                pass
             else:
-                client_args[criteria] = fnmatch.translate(value)
+                # only non-range values are valid criteria for search_regex()
+                patterns = [fnmatch.translate(value)]
+                # Numbers may be stored in another text form, e.g. 6 as 6.0,
+                # so also match the float form of plain finite literals. The
+                # value as given is kept for text fields like "stand=1e5"
+                try:
+                    float_value = float(value)
+                except ValueError:
+                    pass
+                else:
+                    if (math.isfinite(float_value) and '_' not in value
+                            and value == value.strip()
+                            and str(float_value) != value):
+                        logger.debug('Also matching %s as float %s',
+                                     value, float_value)
+                        patterns.append(fnmatch.translate(str(float_value)))
+                client_args[criteria] = '|'.join(patterns)
 
         regex_list = client.search_regex(**client_args)
-        results = regex_list + range_list
 
         # find the repeated items
-        res_size = len(results)
-        repeated = []
-        for i in range(res_size):
-            k = i + 1
-            for j in range(k, res_size):
-                if results[i] == results[j] and results[i] not in repeated:
-                    repeated.append(results[i])
+        regex_names = {res.item.name for res in regex_list}
+        repeated = [res for res in range_list if res.item.name in regex_names]
 
         # we only want to return the ones that have been repeated when
         # they have been matched with both search_regex() & search_range()
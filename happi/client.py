@@ -8,6 +8,7 @@ import re
 import sys
 import time as ttime
 import warnings
+from functools import lru_cache
 
 from . import containers
 from .backends import BACKENDS, DEFAULT_BACKEND
@@ -29,6 +30,24 @@ def _looks_like_database(obj):
             )
 
 
+@lru_cache(maxsize=4)
+def _parse_config(path, mtime, size, inode):
+    """
+    Parse the ``[DEFAULT]`` section of a happi configuration file.
+
+    The result is cached on the absolute path and the file's modification
+    time, size and inode so that repeated clients built from an unchanged
+    file skip the ``ConfigParser`` read. The size and inode guard against
+    rewrites that land within the same timestamp tick on filesystems with
+    coarse modification times. A tuple of key/value pairs is returned so
+    that callers can not mutate the cache.
+    """
+    cfg_parser = configparser.ConfigParser()
+    cfg_file = cfg_parser.read(path)
+    logger.debug("Loading configuration file at %r", cfg_file)
+    return tuple(cfg_parser['DEFAULT'].items())
+
+
 class SearchResult(collections.abc.Mapping):
     """
     A single search result from `Client.search`.
@@ -201,8 +220,9 @@ class Client(collections.abc.Mapping):
 
         """
 
-        # If specified by a string
-        if device_cls in containers.registry:
+        # If specified by a string. Classes are never registry keys, and a
+        # registry miss reloads every entry point, so only look up strings
+        if isinstance(device_cls, str) and device_cls in containers.registry:
             device_cls = containers.registry[device_cls]
 
         # Check that this is a valid HappiItem
@@ -281,7 +301,12 @@ class Client(collections.abc.Mapping):
 
         logger.debug("Gathering information about the device ...")
         doc = self.find_document(**post)
-        # Instantiate HappiItem
+        return self._get_item_from_document(doc)
+
+    def _get_item_from_document(self, doc):
+        """
+        Instantiate a HappiItem from a document already read from the backend.
+        """
         logger.debug("Instantiating device based on found information ...")
         try:
             device = self.create_device(doc['type'], **doc)
@@ -348,7 +373,7 @@ class Client(collections.abc.Mapping):
                 _id = post[self._id_key]
                 logger.debug('Attempting to initialize %s...', _id)
                 # Load HappiItem
-                device = self.find_device(**post)
+                device = self._get_item_from_document(post)
                 logger.debug('Attempting to validate ...')
                 self._validate_device(device)
             except KeyError:
@@ -376,7 +401,8 @@ class Client(collections.abc.Mapping):
     def __getitem__(self, key):
         """Get a device ID."""
         try:
-            device = self.find_device(**self.backend.get_by_id(key))
+            device = self._get_item_from_document(
+                self.backend.get_by_id(key))
         except Exception as ex:
             raise KeyError(key) from ex
 
@@ -397,7 +423,8 @@ class Client(collections.abc.Mapping):
         results = []
         for info in items:
             try:
-                result = wrap_cls(client=self, device=self.find_device(**info))
+                device = self._get_item_from_document(info)
+                result = wrap_cls(client=self, device=device)
                 results.append(result)
             except Exception as exc:
                 logger.warning('Entry for %s is malformed (%s). Skipping.',
@@ -596,8 +623,9 @@ class Client(collections.abc.Mapping):
         # Clean supplied information
         [post.pop(key) for key in self._client_attrs if key in post]
         # Note that device has some unrecognized metadata
-        for key in post.keys():
-            if key not in device.info_names:
+        info_names = set(device.info_names)
+        for key in post:
+            if key not in info_names:
                 logger.debug("HappiItem %r defines an extra piece of "
                              "information under the keyword %s",
                              device, key)
@@ -661,10 +689,10 @@ class Client(collections.abc.Mapping):
             raise RuntimeError(f'happi configuration file not found: {cfg!r}')
 
         # Parse configuration file
-        cfg_parser = configparser.ConfigParser()
-        cfg_file = cfg_parser.read(cfg)
-        logger.debug("Loading configuration file at %r", cfg_file)
-        db_kwargs = cfg_parser['DEFAULT']
+        cfg = os.path.abspath(cfg)
+        stat = os.stat(cfg)
+        db_kwargs = dict(_parse_config(cfg, stat.st_mtime_ns, stat.st_size,
+                                       stat.st_ino))
         # If a backend is specified use it, otherwise default
         if 'backend' in db_kwargs:
             db_str = db_kwargs.pop('backend')
@@ -677,7 +705,9 @@ class Client(collections.abc.Mapping):
         else:
             backend = DEFAULT_BACKEND
 
-        logger.debug("Using Happi backend %r with kwargs", backend, db_kwargs)
+        # Only log the setting names, values may include credentials
+        logger.debug("Using Happi backend %r with kwargs %s",
+                     backend, sorted(db_kwargs))
         # Create our database with provided kwargs
         try:
             database = backend(**db_kwargs)
@@ -337,7 +337,12 @@ class HappiItem(_HappiItemBase, collections.abc.Mapping):
         return post
 
     def __getitem__(self, item):
-        return self.post()[item]
+        # Look the key up directly rather than building the full post
+        if item in self.extraneous:
+            return self.extraneous[item]
+        if item in self._info_attrs:
+            return getattr(self, item)
+        raise KeyError(item)
 
     def __iter__(self):
         yield from self.info_names
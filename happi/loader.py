@@ -6,7 +6,7 @@ import importlib
 import logging
 import sys
 import types
-from functools import partial
+from functools import lru_cache, partial
 from multiprocessing.pool import ThreadPool
 
 from jinja2 import Environment, meta
@@ -17,6 +17,19 @@ logger = logging.getLogger(__name__)
 
 cache = dict()
 main_event_loop = None
+_jinja_env = Environment()
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template):
+    """
+    Parse a Jinja2 template once, returning the compiled template and the set
+    of variable names it uses. Device databases tend to reuse the same handful
+    of templates, e.g. ``"{{prefix}}"``, so this is shared between devices.
+    """
+    ast = _jinja_env.parse(template)
+    return (_jinja_env.from_string(ast),
+            frozenset(meta.find_undeclared_variables(ast)))
 
 
 def fill_template(template, device, enforce_type=False):
@@ -36,16 +49,15 @@ def fill_template(template, device, enforce_type=False):
         the happi information that was used to fill it.
     """
     # Create a template and render our happi information inside it
-    env = Environment().from_string(template)
+    env, info = _compile_template(template)
     filled = env.render(**device.post())
     # Find which variable we used in the template, get the type and convert
     # our rendered template to agree with this
-    info = meta.find_undeclared_variables(env.environment.parse(template))
     if len(info) == 1 and enforce_type:
         # Get the original attribute back from the device. If this does not
         # exist there is a possibility it is a piece of metadata e.t.c
         try:
-            attr_name = info.pop()
+            attr_name = next(iter(info))
             typed_attr = getattr(device, attr_name)
         except AttributeError:
             logger.warning("Can not enforce type to match attribute %s",
@@ -132,7 +144,8 @@ def from_container(device, attach_md=True, use_cache=True, threaded=False):
 
     # Create correctly typed arguments from happi information
     def create_arg(arg):
-        if not isinstance(arg, str):
+        # Only strings with Jinja2 delimiters need to be rendered
+        if not isinstance(arg, str) or '{' not in arg:
             return arg
         return fill_template(arg, device, enforce_type=True)
 
@@ -168,9 +181,17 @@ def import_class(device_class):
     -------
     cls : type
         The class referred to by the input string.
+
+    Raises
+    ------
+    ValueError
+        If ``device_class`` does not include a module path.
     """
 
-    mod, cls = device_class.rsplit('.', 1)
+    mod, sep, cls = device_class.rpartition('.')
+    if not sep:
+        raise ValueError("Device class %r does not include a module path" %
+                         device_class)
     # Import the module if not already present
     # Otherwise use the stashed version in sys.modules
     if mod in sys.modules:
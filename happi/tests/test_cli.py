@@ -123,6 +123,35 @@ def test_search_z(happi_cfg):
     assert [r.device for r in res] == [r.device for r in res_cli]
 
 
+def test_search_z_scientific(happi_cfg):
+    client = happi.client.Client.from_config(cfg=happi_cfg)
+    res = client.search_regex(z="6.0")
+    res_cli = happi.cli.happi_cli(['--verbose', '--path', happi_cfg, 'search',
+                                   'z=6e0'])
+    assert [r.device for r in res] == [r.device for r in res_cli]
+
+
+def test_search_float_like_name(happi_cfg):
+    client = happi.client.Client.from_config(cfg=happi_cfg)
+    item = client.create_device('OphydItem', name='infinity',
+                                prefix='TST:INF', device_class='types.Foo')
+    item.save()
+    res_cli = happi.cli.happi_cli(['--path', happi_cfg, 'search',
+                                   'infinity'])
+    assert [r.item.name for r in res_cli] == ['infinity']
+
+
+def test_search_float_like_text(happi_cfg):
+    client = happi.client.Client.from_config(cfg=happi_cfg)
+    item = client.create_device('OphydItem', name='exp_stand',
+                                prefix='TST:EXP', device_class='types.Foo',
+                                stand='1e5')
+    item.save()
+    res_cli = happi.cli.happi_cli(['--path', happi_cfg, 'search',
+                                   'stand=1e5'])
+    assert [r.item.name for r in res_cli] == ['exp_stand']
+
+
 def test_search_z_range(happi_cfg, caplog):
     client = happi.client.Client.from_config(cfg=happi_cfg)
     res = client.search_range('z', 3.0, 6.0)
@@ -289,9 +318,11 @@ def test_edit(from_user, expected_output, caplog, happi_cfg):
     happi.cli.happi_cli(
         ['--verbose', '--path', happi_cfg, 'edit',
          'happi_name', from_user.pop(0)])
-    for message in caplog.messages:
-        for message, expected in zip(caplog.messages, expected_output):
-            assert expected in message
+    # Only compare against user-facing messages, not the --verbose stream
+    messages = [record.getMessage() for record in caplog.records
+                if record.levelno >= logging.INFO]
+    for message, expected in zip(messages, expected_output):
+        assert expected in message
     # Test invalid field, note the name is changed to new_name
     with pytest.raises(SystemExit):
         happi.cli.happi_cli(
@@ -3,10 +3,11 @@ import os
 import re
 import tempfile
 import types
+from unittest import mock
 
 import pytest
 
-from happi import Client, OphydItem
+from happi import Client, OphydItem, containers
 from happi.backends.json_db import JSONBackend
 from happi.errors import DuplicateError, EntryError, SearchError
 
@@ -67,6 +68,13 @@ def test_create_device(happi_client, device_info):
         happi_client.create_device(int)
 
 
+def test_create_device_skips_registry_reload(happi_client, device_info):
+    with mock.patch.object(containers.registry, 'load') as load:
+        happi_client.create_device(OphydItem, **device_info)
+        happi_client.create_device('OphydItem', **device_info)
+    load.assert_not_called()
+
+
 def test_all_devices(happi_client, device):
     assert happi_client.all_devices == [device]
 
@@ -240,6 +248,16 @@ def test_from_cfg(happi_cfg):
     assert client.backend.path == 'db.json'
 
 
+def test_from_cfg_reloads_on_change(happi_cfg):
+    assert Client.from_config().backend.path == 'db.json'
+    stat = os.stat(happi_cfg)
+    with open(happi_cfg, 'w') as f:
+        f.write("[DEFAULT]\nbackend=json\npath=other.json\n")
+    # Simulate a rewrite within the same timestamp tick
+    os.utime(happi_cfg, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert Client.from_config().backend.path == 'other.json'
+
+
 def test_choices_for_field(happi_client):
     name_choices = happi_client.choices_for_field('name')
     assert name_choices == {'alias'}
@@ -257,6 +275,20 @@ def test_searchresults(happi_client, three_valves):
     assert isinstance(valve1.get(), types.SimpleNamespace)
 
 
+def test_results_do_not_requery_backend(happi_client, three_valves):
+    backend = happi_client.backend
+    with mock.patch.object(backend, 'find', wraps=backend.find) as find:
+        # A single backend query, not one more per result
+        results = happi_client.search()
+        assert len(results) >= 3
+        assert find.call_count == 1
+        find.reset_mock()
+        # Documents are already in hand for validate and __getitem__
+        happi_client.validate()
+        happi_client['VALVE1']
+        find.assert_not_called()
+
+
 def test_client_mapping(happi_client, three_valves):
     assert len(happi_client) == 3
     assert list(dict(happi_client)) == ['VALVE1', 'VALVE2', 'VALVE3']
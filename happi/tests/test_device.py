@@ -124,6 +124,15 @@ def test_dictify():
     assert dict(a) == a.post()
 
 
+def test_getitem():
+    a = Device(name='abcd', prefix='b', note='extra')
+    assert a['name'] == 'abcd'
+    assert a['note'] == 'extra'
+    assert a.get('not_a_key') is None
+    with pytest.raises(KeyError):
+        a['not_a_key']
+
+
 def test_device_copy():
     a = Device(name='abcd', prefix='b')
     b = copy.copy(a)
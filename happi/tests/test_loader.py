@@ -1,7 +1,8 @@
 import pytest
 
 from happi import Device, EntryInfo, cache
-from happi.loader import fill_template, from_container, load_devices
+from happi.loader import (fill_template, from_container, import_class,
+                          load_devices)
 from happi.utils import create_alias
 
 
@@ -29,6 +30,27 @@ def test_fill_template(device):
     assert fill_template(template, device, enforce_type=True) == ""
 
 
+def test_fill_template_cached_per_device():
+    a = TimeDevice(name='a', prefix='Tst:This:A', days=10)
+    b = TimeDevice(name='b', prefix='Tst:This:B', days=20)
+    # The parsed template is shared, but each device renders its own values
+    assert fill_template('{{days}}', a, enforce_type=True) == 10
+    assert fill_template('{{days}}', b, enforce_type=True) == 20
+    # Enforce the type on a rendered value that is not a straight substitution
+    assert fill_template('{{days + 1}}', a, enforce_type=True) == 11
+    assert fill_template('{{days + 1}}', b, enforce_type=True) == 21
+
+
+def test_from_container_plain_string():
+    d = Device(name='plain', prefix='Tst:This:Plain',
+               device_class='types.SimpleNamespace', args=[],
+               kwargs={'text': 'no template here\n', 'name': '{{name}}'})
+    ns = from_container(d, use_cache=False)
+    # Strings without Jinja2 delimiters are passed through untouched
+    assert ns.text == 'no template here\n'
+    assert ns.name == 'plain'
+
+
 def test_from_container():
     # Create a datetime device
     d = TimeDevice(name='test', prefix='Tst:This:1', beamline='TST',
@@ -40,6 +62,15 @@ def test_from_container():
     assert td == datetime.timedelta(days=10, seconds=30)
 
 
+def test_import_class():
+    import datetime
+    assert import_class('datetime.timedelta') is datetime.timedelta
+    with pytest.raises(ValueError):
+        import_class('timedelta')
+    with pytest.raises(ImportError):
+        import_class('datetime.NotAClass')
+
+
 def test_caching():
     # Create a datetime device
     d = TimeDevice(name='test', prefix='Tst:This:2', beamline='TST',